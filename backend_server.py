@@ -1,12 +1,17 @@
 import os
 import re
+import socket
+import sys
 import uuid
 import hashlib
 import tempfile
 import time
+import threading
 import traceback
-from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from io import BytesIO
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query, BackgroundTasks, Body
@@ -23,9 +28,11 @@ except ImportError:
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from openai import OpenAI
+import tiktoken
 from dotenv import load_dotenv
 import certifi
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -38,6 +45,32 @@ model_settings = {
     "max_tokens": 1500
 }
 
+# USD per 1M tokens. Models are matched by exact name or as a dated snapshot
+# of that name (e.g. "gpt-4o-2024-08-06"); anything else has no pricing.
+MODEL_PRICING = {
+    "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+    "gpt-4.1-mini": {"input": 0.40, "cached_input": 0.10, "output": 1.60},
+    "gpt-4.1": {"input": 2.00, "cached_input": 0.50, "output": 8.00},
+    "gpt-4.1-nano": {"input": 0.10, "cached_input": 0.025, "output": 0.40},
+}
+# Input + output token budget per report. The estimate covers the prompt, the
+# configured output tokens and a reserved allowance for file_search results
+# (REPORT_SEARCH_RESULTS chunks of at most FILE_SEARCH_CHUNK_TOKENS each).
+REPORT_TOKEN_BUDGET = int(os.getenv("REPORT_TOKEN_BUDGET", "32000"))
+REPORT_SEARCH_RESULTS = 30
+FILE_SEARCH_CHUNK_TOKENS = int(os.getenv("FILE_SEARCH_CHUNK_TOKENS", "800"))
+
+PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+PROMPT_REGISTRY = [
+    {"id": "fcv_detailed_probabilities", "version": 1, "title": "Prompt detailed (Probabilities)"},
+    {"id": "fcv_logprob_1", "version": 1, "title": "Prompt 1 (Log probability)"},
+    {"id": "fcv_logprob_2", "version": 1, "title": "Prompt 2 (Log probability)"},
+    {"id": "fcv_sections_logprob_3", "version": 1, "title": "Prompt 3 (Important sections with logprobability)"},
+    {"id": "fcv_sections_logprob_4", "version": 1, "title": "Prompt 4 (Important sections with logprobability)"},
+    {"id": "fcv_probabilities_5", "version": 1, "title": "Prompt 5 (Probabilities)"},
+]
+
 app = FastAPI()
 app.add_middleware(
     CORSMiddleware,
@@ -55,6 +88,12 @@ mongo_client = MongoClient(MONGO_URI, tlsCAFile=certifi.where())
 db = mongo_client["projects_db"]
 collection = db["wb_projects"]
 mappings_collection = db["vector_store_mappings"]
+report_usage_collection = db["report_usage"]
+preindex_runs_collection = db["preindex_runs"]
+try:
+    mappings_collection.create_index("doc_hash", unique=True)
+except Exception as e:
+    print("Warning: could not create unique index on vector_store_mappings.doc_hash:", str(e))
 
 openai_client = None
 try:
@@ -69,6 +108,26 @@ huggingface_docs = [
 ]
 upload_storage = {}
 
+PREINDEX_BATCH_SIZE = int(os.getenv("PREINDEX_BATCH_SIZE", "100"))
+PREINDEX_MAX_WORKERS = int(os.getenv("PREINDEX_MAX_WORKERS", "16"))
+PREINDEX_POLL_TIMEOUT = int(os.getenv("PREINDEX_POLL_TIMEOUT", "600"))
+PREINDEX_POLL_INTERVAL = 2
+PREINDEX_LEASE_ID = "preindex"
+PREINDEX_LEASE_SECONDS = int(os.getenv("PREINDEX_LEASE_SECONDS", "300"))
+preindex_status = {
+    "running": False,
+    "started_at": None,
+    "finished_at": None,
+    "total": 0,
+    "already_indexed": 0,
+    "duplicates": 0,
+    "empty": 0,
+    "indexed": 0,
+    "failed": [],
+    "docs_per_second": 0.0,
+    "mb_per_second": 0.0,
+}
+
 
 class DocumentEntry(BaseModel):
     id: str
@@ -102,18 +161,125 @@ class IndexResponse(BaseModel):
     message: Optional[str] = None
 
 
+class PreindexResponse(BaseModel):
+    success: bool
+    message: Optional[str] = None
+
+
+class PromptEntry(BaseModel):
+    id: str
+    version: int
+    title: str
+    text: str
+    tokens: Optional[int] = None
+
+
 class ReportRequest(BaseModel):
-    prompt: str
+    promptId: Optional[str] = None
+    promptVersion: Optional[int] = None
+    prompt: Optional[str] = None  # Free-text prompt, used only when no promptId is given
 
 
 class ReportResponse(BaseModel):
     reportText: str
+    usage: Optional[dict] = None
 
 
 class PDFRequestPayload(BaseModel):
     fullText: str
 
 
+def load_prompt_registry() -> dict:
+    """
+    Reads every registered prompt from PROMPTS_DIR ("<id>.v<version>.txt").
+    Returns a dict keyed by (id, version).
+    """
+    registry = {}
+    for entry in PROMPT_REGISTRY:
+        path = os.path.join(PROMPTS_DIR, f"{entry['id']}.v{entry['version']}.txt")
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read().strip()
+        except OSError as e:
+            print(f"Warning: could not load prompt {entry['id']} v{entry['version']}: {e}")
+            continue
+        registry[(entry["id"], entry["version"])] = dict(entry, text=text)
+    return registry
+
+
+prompt_registry = load_prompt_registry()
+
+
+def get_registered_prompt(prompt_id: str, version: Optional[int] = None) -> Optional[dict]:
+    """
+    Returns the requested prompt version, or the latest one when no version is given.
+    """
+    if version is not None:
+        return prompt_registry.get((prompt_id, version))
+    versions = [v for (pid, v) in prompt_registry if pid == prompt_id]
+    if not versions:
+        return None
+    return prompt_registry[(prompt_id, max(versions))]
+
+
+def load_token_encoding():
+    """
+    Loads the o200k_base encoding used by the gpt-4o and gpt-4.1 families.
+    tiktoken downloads it on first use, so a failure only disables local counting.
+    """
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print("Warning: tiktoken encoding unavailable, token budgets will not be enforced:", str(e))
+        return None
+
+
+token_encoding = load_token_encoding()
+
+
+@lru_cache(maxsize=256)
+def count_tokens(text: str) -> Optional[int]:
+    if token_encoding is None:
+        return None
+    return len(token_encoding.encode(text, disallowed_special=()))
+
+
+def get_model_pricing(model: str) -> Optional[dict]:
+    for name, pricing in MODEL_PRICING.items():
+        if re.fullmatch(rf"{re.escape(name)}(-\d{{4}}-\d{{2}}-\d{{2}})?", model):
+            return pricing
+    return None
+
+
+def compute_cost(model: str, input_tokens: int, cached_tokens: int, output_tokens: int) -> Optional[float]:
+    """
+    Returns the cost in USD, billing cached input tokens at the discounted rate.
+    Returns None for models without known pricing.
+    """
+    pricing = get_model_pricing(model)
+    if not pricing:
+        return None
+    cost = (
+        (input_tokens - cached_tokens) * pricing["input"]
+        + cached_tokens * pricing["cached_input"]
+        + output_tokens * pricing["output"]
+    ) / 1_000_000
+    return round(cost, 6)
+
+
+def build_report_prompt(protocol_text: str, document_id: str) -> Tuple[str, str]:
+    """
+    Splits the report prompt into a static prefix and a short variable suffix.
+    The protocol goes into `instructions` unchanged for every document, so the
+    provider's automatic prompt caching can reuse it; only the input differs.
+    """
+    user_input = (
+        f"Evaluate the Project Appraisal Document for project {document_id} "
+        "using the file search results, following the protocol above."
+    )
+    return protocol_text, user_input
+
+
 def create_vector_store() -> str:
     """
     Creates a new vector store using the OpenAI client and returns its ID.
@@ -219,12 +385,15 @@ def index_document_logic(document_id: str, doc_text: str) -> str:
         attach_file_to_vector_store(vector_store_id, file_id)
     except Exception as e:
         raise Exception(f"Indexing failed: {str(e)}")
-    mappings_collection.insert_one({
-        "doc_hash": doc_hash,
-        "vector_store_id": vector_store_id,
-        "document_id": document_id,
-        "created_at": datetime.utcnow()
-    })
+    mappings_collection.update_one(
+        {"doc_hash": doc_hash},
+        {"$set": {
+            "vector_store_id": vector_store_id,
+            "document_id": document_id,
+            "created_at": datetime.utcnow()
+        }},
+        upsert=True
+    )
     try:
         indexing_response = openai_client.responses.create(
             model="gpt-4o",
@@ -236,24 +405,298 @@ def index_document_logic(document_id: str, doc_text: str) -> str:
         print("Indexing response error:", str(e))
     return vector_store_id
 
-def do_fcv_analysis(doc_text: str, user_prompt: str, vector_store_id: str) -> str:
+
+def collect_unindexed_projects() -> Tuple[List[dict], dict]:
+    """
+    Walks "wb_projects" and returns the project ids and hashes of the PADs not yet
+    present in "vector_store_mappings", plus counts of what was left out:
+    already indexed, duplicate texts within the corpus (kept once) and empty PADs.
+    Only the hashes are kept in memory; the texts are re-read batch by batch.
+    """
+    known_hashes = set(mappings_collection.distinct("doc_hash"))
+    pending_hashes = set()
+    pending = []
+    counts = {"already_indexed": 0, "duplicates": 0, "empty": 0}
+    for doc in collection.find({}, {"_id": 0, "project_id": 1, "pad_doc": 1}):
+        doc_text = doc.get("pad_doc") or ""
+        if not doc_text.strip():
+            counts["empty"] += 1
+            continue
+        doc_hash = compute_doc_hash(doc_text)
+        if doc_hash in known_hashes:
+            counts["already_indexed"] += 1
+            continue
+        if doc_hash in pending_hashes:
+            counts["duplicates"] += 1
+            continue
+        pending_hashes.add(doc_hash)
+        pending.append({"document_id": doc["project_id"], "doc_hash": doc_hash})
+    return pending, counts
+
+
+def new_preindex_lease_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+
+
+def acquire_preindex_lease(owner: str) -> bool:
+    """
+    Takes the pre-indexing lease in "preindex_runs" if it is free or expired.
+    The lease is shared by every process (CLI, uvicorn workers), so only one
+    run uploads the pending set at a time.
+    """
+    now = datetime.utcnow()
+    try:
+        lease = preindex_runs_collection.find_one_and_update(
+            {"_id": PREINDEX_LEASE_ID, "$or": [{"expires_at": {"$lt": now}}, {"owner": owner}]},
+            {"$set": {
+                "owner": owner,
+                "started_at": now,
+                "expires_at": now + timedelta(seconds=PREINDEX_LEASE_SECONDS),
+                "finished_at": None
+            }},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # The lease document exists and is held by another owner.
+        return False
+    return lease is not None and lease.get("owner") == owner
+
+
+def renew_preindex_lease(owner: str) -> bool:
+    result = preindex_runs_collection.update_one(
+        {"_id": PREINDEX_LEASE_ID, "owner": owner},
+        {"$set": {"expires_at": datetime.utcnow() + timedelta(seconds=PREINDEX_LEASE_SECONDS)}}
+    )
+    return result.matched_count == 1
+
+
+def release_preindex_lease(owner: str):
+    now = datetime.utcnow()
+    preindex_runs_collection.update_one(
+        {"_id": PREINDEX_LEASE_ID, "owner": owner},
+        {"$set": {"expires_at": now, "finished_at": now}}
+    )
+
+
+def wait_for_vector_store_files(vector_store_id: str, timeout: int = PREINDEX_POLL_TIMEOUT):
+    """
+    Polls the vector store until no file is still being ingested and returns its file counts.
+    """
+    deadline = time.time() + timeout
+    while True:
+        file_counts = openai_client.vector_stores.retrieve(vector_store_id).file_counts
+        if file_counts.in_progress == 0:
+            return file_counts
+        if time.time() > deadline:
+            raise Exception(f"File ingestion still in progress after {timeout}s.")
+        time.sleep(PREINDEX_POLL_INTERVAL)
+
+
+def delete_indexed_resources(vector_store_id: Optional[str], file_id: str):
+    """
+    Best-effort removal of a vector store and its file, so failed documents leave nothing behind.
+    """
+    try:
+        if vector_store_id:
+            openai_client.vector_stores.delete(vector_store_id)
+        openai_client.files.delete(file_id)
+    except Exception as e:
+        print(f"Cleanup failed for file {file_id}: {str(e)}")
+
+
+def preindex_single_document(document_id: str, doc_text: str) -> Tuple[str, str]:
     """
-    Example function that calls your LLM to generate the final 'report' text.
+    Uploads the document and creates its vector store with the file attached
+    in the same call, so each document costs two requests instead of four.
+    Returns (vector_store_id, file_id) only once the file has been ingested
+    successfully; on failure the uploaded file (and store) are deleted.
+    """
+    file_id = upload_document_as_file(doc_text)
+    vector_store_id = None
+    try:
+        response = openai_client.vector_stores.create(
+            name=f"Document Index {document_id}",
+            file_ids=[file_id]
+        )
+        vector_store_id = response.id
+        if not vector_store_id:
+            raise Exception("No vector store id returned.")
+        file_counts = wait_for_vector_store_files(vector_store_id)
+        if file_counts.failed > 0 or file_counts.completed == 0:
+            raise Exception(
+                f"File ingestion failed ({file_counts.completed} completed, {file_counts.failed} failed)."
+            )
+        return vector_store_id, file_id
+    except Exception as e:
+        delete_indexed_resources(vector_store_id, file_id)
+        raise Exception(f"Error indexing {document_id}: {str(e)}")
+
+
+def preindex_corpus(
+    batch_size: int = PREINDEX_BATCH_SIZE,
+    max_workers: int = PREINDEX_MAX_WORKERS,
+    lease_owner: Optional[str] = None
+) -> dict:
+    """
+    Warms the whole "wb_projects" portfolio:
+      - Skip every PAD whose hash already has a vector store mapping.
+      - Process the rest in batches, re-reading the texts of each batch from MongoDB
+        and uploading and attaching files concurrently.
+      - Upsert each mapping as soon as its document is ingested, so an interrupted
+        run leaves no ingested store unmapped beyond the ones in flight.
+        Documents whose ingestion failed get no mapping and are retried next run.
+      - Report progress and throughput in `preindex_status` after each batch.
+
+    The run holds the "preindex_runs" lease for its whole duration. Pass
+    lease_owner when the caller has already acquired it.
+    """
+    if lease_owner is None:
+        if not openai_client:
+            raise Exception("OpenAI client not configured.")
+        lease_owner = new_preindex_lease_owner()
+        if not acquire_preindex_lease(lease_owner):
+            raise Exception("Pre-indexing is already running.")
+
+    lease_lost = threading.Event()
+    stop_heartbeat = threading.Event()
+
+    def heartbeat():
+        while not stop_heartbeat.wait(PREINDEX_LEASE_SECONDS / 3):
+            try:
+                if not renew_preindex_lease(lease_owner):
+                    lease_lost.set()
+                    return
+            except Exception as e:
+                print("Pre-indexing lease renewal error:", str(e))
+
+    heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+    heartbeat_thread.start()
+    try:
+        preindex_status.update({
+            "running": True,
+            "started_at": datetime.utcnow().isoformat(),
+            "finished_at": None,
+            "total": 0,
+            "already_indexed": 0,
+            "duplicates": 0,
+            "empty": 0,
+            "indexed": 0,
+            "failed": [],
+            "docs_per_second": 0.0,
+            "mb_per_second": 0.0,
+        })
+        pending, counts = collect_unindexed_projects()
+        preindex_status.update(counts)
+        preindex_status["total"] = len(pending)
+        print(
+            f"Pre-indexing {len(pending)} documents ({counts['already_indexed']} already indexed, "
+            f"{counts['duplicates']} duplicates, {counts['empty']} empty)"
+        )
+
+        started = time.time()
+        uploaded_bytes = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(pending), batch_size):
+                if lease_lost.is_set():
+                    raise Exception("Pre-indexing lease lost to another run; stopping.")
+                batch = pending[start:start + batch_size]
+                texts = {
+                    doc["project_id"]: doc.get("pad_doc") or ""
+                    for doc in collection.find(
+                        {"project_id": {"$in": [item["document_id"] for item in batch]}},
+                        {"_id": 0, "project_id": 1, "pad_doc": 1}
+                    )
+                }
+                futures = {}
+                for item in batch:
+                    doc_text = texts.get(item["document_id"], "")
+                    if not doc_text.strip():
+                        preindex_status["failed"].append(
+                            {"document_id": item["document_id"], "error": "Document missing or empty."}
+                        )
+                        continue
+                    # The PAD may have changed since collection; map the text actually uploaded.
+                    item = dict(item, doc_hash=compute_doc_hash(doc_text), size=len(doc_text.encode("utf-8")))
+                    futures[executor.submit(preindex_single_document, item["document_id"], doc_text)] = item
+                del texts
+
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        vector_store_id, file_id = future.result()
+                    except Exception as e:
+                        preindex_status["failed"].append({"document_id": item["document_id"], "error": str(e)})
+                        continue
+                    try:
+                        mappings_collection.update_one(
+                            {"doc_hash": item["doc_hash"]},
+                            {"$set": {
+                                "vector_store_id": vector_store_id,
+                                "document_id": item["document_id"],
+                                "created_at": datetime.utcnow()
+                            }},
+                            upsert=True
+                        )
+                    except Exception as e:
+                        delete_indexed_resources(vector_store_id, file_id)
+                        preindex_status["failed"].append(
+                            {"document_id": item["document_id"], "error": f"Error saving mapping: {str(e)}"}
+                        )
+                        continue
+                    uploaded_bytes += item["size"]
+                    preindex_status["indexed"] += 1
+
+                elapsed = max(time.time() - started, 1e-6)
+                preindex_status["docs_per_second"] = round(preindex_status["indexed"] / elapsed, 2)
+                preindex_status["mb_per_second"] = round(uploaded_bytes / elapsed / 1_000_000, 3)
+                print(
+                    f"Pre-indexed {preindex_status['indexed']}/{len(pending)} "
+                    f"({len(preindex_status['failed'])} failed) - "
+                    f"{preindex_status['docs_per_second']} docs/s, {preindex_status['mb_per_second']} MB/s"
+                )
+        preindex_status["running"] = False
+        preindex_status["finished_at"] = datetime.utcnow().isoformat()
+        return dict(preindex_status)
+    finally:
+        preindex_status["running"] = False
+        if not preindex_status["finished_at"]:
+            preindex_status["finished_at"] = datetime.utcnow().isoformat()
+        stop_heartbeat.set()
+        release_preindex_lease(lease_owner)
+
+
+def run_preindex_in_background(lease_owner: str):
+    """
+    Background task for the endpoint, which has already acquired the lease.
+    """
+    try:
+        preindex_corpus(lease_owner=lease_owner)
+    except Exception as e:
+        print("Pre-indexing error:", str(e))
+        traceback.print_exc()
+
+
+def do_fcv_analysis(instructions: str, user_input: str, vector_store_id: str) -> Tuple[str, Optional[dict]]:
+    """
+    Calls the LLM to generate the final 'report' text.
     We replicate the logic from the Streamlit query_document approach:
       1) Perform a search on vector_store_id
-      2) Return the final LLM text plus usage/cost info
+      2) Return the final LLM text plus the usage/cost record
     """
     if not openai_client:
-        return "(OpenAI client not configured, returning mock text.)"
+        return "(OpenAI client not configured, returning mock text.)", None
 
+    model = model_settings["model"]
     try:
         response = openai_client.responses.create(
-            model=model_settings["model"],
-            input=user_prompt,
+            model=model,
+            instructions=instructions,
+            input=user_input,
             tools=[{
                 "type": "file_search",
                 "vector_store_ids": [vector_store_id],
-                "max_num_results": 30
+                "max_num_results": REPORT_SEARCH_RESULTS
             }],
             temperature=model_settings["temperature"],
             max_output_tokens=model_settings["max_tokens"]
@@ -268,23 +711,35 @@ def do_fcv_analysis(doc_text: str, user_prompt: str, vector_store_id: str) -> st
         else:
             answer = "(No output array returned.)"
 
+        usage_record = None
         usage = getattr(response, "usage", None)
         if usage and hasattr(usage, "input_tokens"):
             input_tokens = usage.input_tokens
             output_tokens = usage.output_tokens
-            cost_estimate = "(Cost calculation here...)"
+            input_details = getattr(usage, "input_tokens_details", None)
+            cached_tokens = getattr(input_details, "cached_tokens", 0) or 0
+            billed_model = getattr(response, "model", None) or model
+            cost = compute_cost(billed_model, input_tokens, cached_tokens, output_tokens)
+            usage_record = {
+                "model": billed_model,
+                "input_tokens": input_tokens,
+                "cached_tokens": cached_tokens,
+                "output_tokens": output_tokens,
+                "cost_usd": cost,
+            }
+            cost_text = f"${cost:.4f}" if cost is not None else f"(no pricing for {billed_model})"
             answer += (
                 "\n\n---\n"
                 "🧮 **Usage Details**\n"
-                f"- Input tokens: {input_tokens}\n"
+                f"- Input tokens: {input_tokens} ({cached_tokens} cached)\n"
                 f"- Output tokens: {output_tokens}\n"
-                f"- Estimated cost: {cost_estimate}\n"
+                f"- Estimated cost: {cost_text}\n"
             )
 
-        return answer
+        return answer, usage_record
 
     except Exception as e:
-        return f"Error calling openai_client in do_fcv_analysis: {str(e)}"
+        return f"Error calling openai_client in do_fcv_analysis: {str(e)}", None
 
 def extract_report_content(llm_output: str):
     """
@@ -551,6 +1006,32 @@ def index_document_endpoint(document_id: str):
         raise HTTPException(500, f"Indexing failed: {str(e)}")
 
 
+@app.post("/documents/preindex", response_model=PreindexResponse)
+def preindex_documents_endpoint(background_tasks: BackgroundTasks):
+    """
+    Starts pre-indexing every MongoDB document that has no vector store mapping yet.
+    Progress can be followed on GET /documents/preindex/status.
+    """
+    if not openai_client:
+        raise HTTPException(500, "OpenAI client not configured.")
+    lease_owner = new_preindex_lease_owner()
+    if not acquire_preindex_lease(lease_owner):
+        raise HTTPException(409, "Pre-indexing is already running.")
+    preindex_status["running"] = True
+    background_tasks.add_task(run_preindex_in_background, lease_owner)
+    return PreindexResponse(success=True, message="Pre-indexing started.")
+
+
+@app.get("/documents/preindex/status")
+def preindex_status_endpoint():
+    """
+    Returns the progress and throughput of the current or last pre-indexing run
+    in this process, plus the shared lease showing which process holds it.
+    """
+    lease = preindex_runs_collection.find_one({"_id": PREINDEX_LEASE_ID}, {"_id": 0})
+    return dict(preindex_status, lease=lease)
+
+
 @app.post("/settings")
 def update_settings(settings: ModelSettings = Body(...)):
     """
@@ -622,11 +1103,30 @@ def chat_document(document_id: str, payload: ChatRequest):
 
 
 
+@app.get("/prompts", response_model=List[PromptEntry])
+def list_prompts():
+    """
+    Returns every registered prompt version with its local token count
+    (None when the tokenizer is unavailable).
+    """
+    return [
+        PromptEntry(
+            id=entry["id"],
+            version=entry["version"],
+            title=entry["title"],
+            text=entry["text"],
+            tokens=count_tokens(entry["text"])
+        )
+        for entry in prompt_registry.values()
+    ]
+
+
 @app.post("/documents/{document_id}/report", response_model=ReportResponse)
 def generate_report(document_id: str, body: ReportRequest):
     """
     Generates an analysis report by retrieving the document, confirming indexing,
-    and querying the LLM.
+    and querying the LLM. Registered prompts are resolved by promptId/promptVersion;
+    token usage and cost are recorded in "report_usage".
     """
     doc_text = find_doc_text_by_id(document_id)
     if not doc_text:
@@ -636,8 +1136,52 @@ def generate_report(document_id: str, body: ReportRequest):
     if not mapping or not mapping.get("vector_store_id"):
         raise HTTPException(400, "Document not indexed. Please index first.")
     vs_id = mapping["vector_store_id"]
-    final_text = do_fcv_analysis(doc_text, body.prompt, vs_id)
-    return ReportResponse(reportText=final_text)
+
+    if body.promptId:
+        registered = get_registered_prompt(body.promptId, body.promptVersion)
+        if not registered:
+            raise HTTPException(404, f"Prompt {body.promptId} (version {body.promptVersion or 'latest'}) not found")
+        protocol_text = registered["text"]
+        prompt_version = registered["version"]
+    elif body.prompt and body.prompt.strip():
+        protocol_text = body.prompt.strip()
+        prompt_version = None
+    else:
+        raise HTTPException(400, "Either 'promptId' or 'prompt' is required.")
+
+    instructions, user_input = build_report_prompt(protocol_text, document_id)
+    retrieval_tokens = REPORT_SEARCH_RESULTS * FILE_SEARCH_CHUNK_TOKENS
+    instruction_tokens = count_tokens(instructions)
+    input_tokens = count_tokens(user_input)
+    prompt_tokens = None
+    if instruction_tokens is not None and input_tokens is not None:
+        prompt_tokens = instruction_tokens + input_tokens
+        estimated_total = prompt_tokens + retrieval_tokens + model_settings["max_tokens"]
+        if estimated_total > REPORT_TOKEN_BUDGET:
+            raise HTTPException(
+                413,
+                f"Report needs an estimated {estimated_total} tokens ({prompt_tokens} prompt, "
+                f"{retrieval_tokens} reserved for search results, {model_settings['max_tokens']} output), "
+                f"over the budget of {REPORT_TOKEN_BUDGET}."
+            )
+
+    final_text, usage = do_fcv_analysis(instructions, user_input, vs_id)
+    if usage:
+        # Estimated vs actual input_tokens shows how much the retrieval allowance is off.
+        usage["prompt_tokens_estimate"] = prompt_tokens
+        usage["retrieval_tokens_reserved"] = retrieval_tokens
+        usage["input_tokens_estimate"] = prompt_tokens + retrieval_tokens if prompt_tokens is not None else None
+        try:
+            report_usage_collection.insert_one(dict(
+                usage,
+                document_id=document_id,
+                prompt_id=body.promptId,
+                prompt_version=prompt_version,
+                created_at=datetime.utcnow()
+            ))
+        except Exception as e:
+            print("Failed to record report usage:", str(e))
+    return ReportResponse(reportText=final_text, usage=usage)
 
 
 @app.post("/documents/{document_id}/report-pdf")
@@ -683,6 +1227,14 @@ def export_data(document_id: str, format: str = Query(...)):
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "preindex":
+        result = preindex_corpus()
+        print(
+            f"Pre-indexing done: {result['indexed']} indexed, {result['already_indexed']} already indexed, "
+            f"{result['duplicates']} duplicates, {result['empty']} empty, {len(result['failed'])} failed"
+        )
+        sys.exit(1 if result["failed"] else 0)
+
     import uvicorn
 
     uvicorn.run("backend_server:app", host="0.0.0.0", port=8000, reload=True)
@@ -20,8 +20,7 @@ import {
   SidebarHeader,
 } from "@/components/ui/sidebar";
 import { toast } from "sonner";
-import { api } from "@/services/api";
-import { ALL_PROMPTS } from "@/services/prompts";
+import { api, PromptEntry } from "@/services/api";
 
 interface AppSidebarProps {
   isIndexed?: boolean;
@@ -32,18 +31,29 @@ export function AppSidebar({
   isIndexed = false,
   selectedDocumentId = null,
 }: AppSidebarProps) {
-  const promptKeys = Object.keys(ALL_PROMPTS);
-  const [availablePrompts] = useState([...promptKeys, "Custom Prompt"]);
-  const [selectedPrompt, setSelectedPrompt] = useState(promptKeys[0]);
-  const [customPrompt, setCustomPrompt] = useState(ALL_PROMPTS[promptKeys[0]]);
+  const [availablePrompts, setAvailablePrompts] = useState<PromptEntry[]>([]);
+  const [selectedPrompt, setSelectedPrompt] = useState("Custom Prompt");
+  const [customPrompt, setCustomPrompt] = useState("");
   const [isGeneratingReport, setIsGeneratingReport] = useState(false);
   const [reportPreview, setReportPreview] = useState("");
+  const registeredPrompt = availablePrompts.find(
+    (prompt) => prompt.id === selectedPrompt
+  );
+
   useEffect(() => {
-    if (selectedPrompt === "Custom Prompt") {
-      return;
+    api.getPrompts().then((prompts) => {
+      setAvailablePrompts(prompts);
+      if (prompts.length > 0) {
+        setSelectedPrompt(prompts[0].id);
+      }
+    });
+  }, []);
+
+  useEffect(() => {
+    if (registeredPrompt) {
+      setCustomPrompt(registeredPrompt.text);
     }
-    setCustomPrompt(ALL_PROMPTS[selectedPrompt]);
-  }, [selectedPrompt]);
+  }, [registeredPrompt]);
 
   const handleUpdateProtocol = () => {
     toast.success("Analysis protocol updated successfully");
@@ -57,10 +67,15 @@ export function AppSidebar({
     setIsGeneratingReport(true);
 
     try {
-      const response = await api.generateReport(
-        selectedDocumentId,
-        customPrompt
-      );
+      // Registered prompts are sent by id; only edited or custom text is sent in full.
+      const prompt =
+        registeredPrompt && registeredPrompt.text === customPrompt
+          ? {
+              promptId: registeredPrompt.id,
+              promptVersion: registeredPrompt.version,
+            }
+          : { prompt: customPrompt };
+      const response = await api.generateReport(selectedDocumentId, prompt);
       setReportPreview(response.reportText);
 
       toast.success("Report generated successfully");
@@ -131,11 +146,12 @@ export function AppSidebar({
                     <SelectValue placeholder="Select a prompt" />
                   </SelectTrigger>
                   <SelectContent>
-                    {availablePrompts.map((promptKey) => (
-                      <SelectItem key={promptKey} value={promptKey}>
-                        {promptKey}
+                    {availablePrompts.map((prompt) => (
+                      <SelectItem key={prompt.id} value={prompt.id}>
+                        {prompt.title}
                       </SelectItem>
                     ))}
+                    <SelectItem value="Custom Prompt">Custom Prompt</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
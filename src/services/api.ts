@@ -26,6 +26,29 @@ export interface ModelSettings {
   };
 }
 
+export interface PromptEntry {
+  id: string;
+  version: number;
+  title: string;
+  text: string;
+  tokens: number | null;
+}
+
+export interface ReportUsage {
+  model: string;
+  input_tokens: number;
+  cached_tokens: number;
+  output_tokens: number;
+  cost_usd: number | null;
+  prompt_tokens_estimate: number | null;
+  retrieval_tokens_reserved: number;
+  input_tokens_estimate: number | null;
+}
+
+export type ReportPrompt =
+  | { promptId: string; promptVersion?: number }
+  | { prompt: string };
+
 export interface FCVScore {
   characteristic: string;
   score: number;
@@ -161,10 +184,23 @@ export const api = {
     }
   },
 
+  async getPrompts(): Promise<PromptEntry[]> {
+    try {
+      const response = await fetch(`${API_URL}/prompts`);
+      if (!response.ok) {
+        throw new Error(`Failed to fetch prompts: ${response.statusText}`);
+      }
+      return await response.json();
+    } catch (error) {
+      handleError(error);
+      return [];
+    }
+  },
+
   async generateReport(
     documentId: string,
-    prompt: string
-  ): Promise<{ reportText: string }> {
+    prompt: ReportPrompt
+  ): Promise<{ reportText: string; usage?: ReportUsage | null }> {
     console.log("[api] → generateReport", { documentId, prompt });
     try {
       const response = await fetch(
@@ -172,7 +208,7 @@ export const api = {
         {
           method: "POST",
           headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ prompt }),
+          body: JSON.stringify(prompt),
         }
       );
       if (!response.ok) {